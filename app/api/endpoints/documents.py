@@ -1,13 +1,15 @@
 """
 Document endpoints demonstrating IDOR mitigations
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
 from app.core.security_enhanced import get_current_user_id, get_current_user_with_id
-from app.models.user import User
-from app.schemas.document import DocumentCreate, DocumentResponse, DocumentUpdate
+from app.schemas.document import (
+    DocumentCreate, DocumentResponse, DocumentSummaryResponse, DocumentUpdate
+)
 from app.services.document_service import DocumentService
 
 router = APIRouter()
@@ -34,6 +36,23 @@ async def get_document_vulnerable(document_id: int, db: Session = Depends(get_db
 # MITIGATION #1: Route-level owner check
 # ============================================================================
 
+# Registered before /secure/{document_id} so "me" is not parsed as an ID
+@router.get("/secure/me", response_model=List[DocumentSummaryResponse])
+async def get_my_documents(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get a page of the current user's documents (without content)"""
+    documents = DocumentService.get_user_documents(db, current_user_id, limit, offset)
+    # Serialize once, skip response_model revalidation
+    return ORJSONResponse([
+        DocumentSummaryResponse.model_validate(document).model_dump(mode="json")
+        for document in documents
+    ])
+
+
 @router.get("/secure/{document_id}", response_model=DocumentResponse)
 async def get_document_secure(
     document_id: int, 
@@ -44,12 +63,9 @@ async def get_document_secure(
     SECURE ENDPOINT - Mitigation #1: Route-level owner check
     Explicit ownership verification in the route handler
     """
-    # Get current user to check admin status
-    current_user = db.query(User).filter(User.id == current_user_id).first()
-    is_admin = current_user.role == "admin" if current_user else False
-    
-    document = DocumentService.get_document_with_ownership_check(
-        db, document_id, current_user_id, is_admin
+    # Ownership and admin status are checked in a single query
+    document = DocumentService.get_document_authorized(
+        db, document_id, current_user_id
     )
     
     if not document:
@@ -59,16 +75,6 @@ async def get_document_secure(
     return document
 
 
-@router.get("/secure/me", response_model=List[DocumentResponse])
-async def get_my_documents(
-    current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
-):
-    """Get current user's documents"""
-    documents = DocumentService.get_user_documents(db, current_user_id)
-    return documents
-
-
 # ============================================================================
 # MITIGATION #2: PostgreSQL RLS (demonstration)
 # ============================================================================
@@ -85,16 +91,17 @@ async def get_document_rls(
     
     Note: This is a demonstration. In a real PostgreSQL setup, you would:
     1. Enable RLS: ALTER TABLE documents ENABLE ROW LEVEL SECURITY;
-    2. Create policy: CREATE POLICY doc_owner_select ON documents FOR SELECT USING (owner_id = current_setting('app.user_id')::int);
+    2. Create policy: CREATE POLICY doc_owner_select ON documents FOR SELECT USING (owner_id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int));
     3. Use the middleware to set app.user_id parameter
+    
+    Wrapping current_setting() in a subselect makes PostgreSQL evaluate it
+    once per query (InitPlan) instead of once per row.
+    See migrations/002_documents_rls.sql for the full policy set.
     """
     # For SQLite demonstration, we still use application-level checks
     # In PostgreSQL, RLS would handle this automatically
-    current_user = db.query(User).filter(User.id == current_user_id).first()
-    is_admin = current_user.role == "admin" if current_user else False
-    
-    document = DocumentService.get_document_with_ownership_check(
-        db, document_id, current_user_id, is_admin
+    document = DocumentService.get_document_authorized(
+        db, document_id, current_user_id
     )
     
     if not document:
@@ -126,11 +133,8 @@ async def update_document(
     db: Session = Depends(get_db)
 ):
     """Update a document with ownership check"""
-    current_user = db.query(User).filter(User.id == current_user_id).first()
-    is_admin = current_user.role == "admin" if current_user else False
-    
     document = DocumentService.update_document(
-        db, document_id, document_data, current_user_id, is_admin
+        db, document_id, document_data, current_user_id
     )
     
     if not document:
@@ -146,11 +150,8 @@ async def delete_document(
     db: Session = Depends(get_db)
 ):
     """Delete a document with ownership check"""
-    current_user = db.query(User).filter(User.id == current_user_id).first()
-    is_admin = current_user.role == "admin" if current_user else False
-    
     success = DocumentService.delete_document(
-        db, document_id, current_user_id, is_admin
+        db, document_id, current_user_id
     )
     
     if not success:
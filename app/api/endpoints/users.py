@@ -1,7 +1,8 @@
 """
 User endpoints for authentication and basic user management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
@@ -9,6 +10,7 @@ from app.core.auth import get_current_user
 from app.models.user import User
 from app.schemas.user import UserResponse
 from app.services.user_service import UserService
+from app.utils.cache import users_cache
 
 router = APIRouter()
 
@@ -24,9 +26,21 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/", response_model=List[UserResponse])
-async def list_all_users(db: Session = Depends(get_db)):
-    """List all users (for demonstration only)"""
-    return UserService.get_all_users(db)
+async def list_all_users(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """List a page of users (for demonstration only)"""
+    users = users_cache.get((limit, offset))
+    if users is None:
+        users = [
+            UserResponse.model_validate(user).model_dump(mode="json")
+            for user in UserService.get_all_users(db, limit, offset)
+        ]
+        users_cache.set((limit, offset), users)
+    # Already serialized, skip response_model revalidation
+    return ORJSONResponse(users)
 
 
 # ============================================================================
@@ -2,56 +2,31 @@
 Authentication dependencies and middleware
 """
 from fastapi import HTTPException, status, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.core.security import verify_token
-from app.models.user import User
+from app.core.security import get_password_hash, verify_password
+from app.core.security_enhanced import get_current_user
+from app.models.user import ADMIN_ROLE, User
+from app.services.user_service import UserService
 
-# HTTP authentication configuration
-security = HTTPBearer()
 
-
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current user based on JWT token"""
-    try:
-        token = credentials.credentials
-        username = verify_token(token)
-        user = db.query(User).filter(User.username == username).first()
-        
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return user
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+# Hash checked against when the username does not exist, so unknown and
+# known usernames take the same bcrypt time (no user enumeration by timing)
+_DUMMY_HASH = get_password_hash("dummy-password")
 
 
 def authenticate_user(db: Session, username: str, password: str) -> User:
     """Authenticate a user with username and password"""
-    from app.core.security import verify_password
-    
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
+    user = UserService.get_user_by_username(db, username)
+    hashed_password = user.hashed_password if user else _DUMMY_HASH
+    password_ok = verify_password(password, hashed_password)
+    if not user or not password_ok:
         return None
     return user
 
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to require admin permissions"""
-    if current_user.role != "admin":
+    if current_user.role != ADMIN_ROLE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin permissions required"
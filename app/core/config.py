@@ -1,7 +1,9 @@
 """
 Centralized application configuration
 """
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -10,20 +12,32 @@ class Settings(BaseSettings):
     
     # Database configuration
     DATABASE_URL: str = "sqlite:///./users.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
     
     # JWT security configuration
     SECRET_KEY: str = "your_very_secure_secret_key_here_change_in_production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password hashing cost (bcrypt log2 rounds, 4-31); calibrate with
+    # python calibrate_bcrypt.py on the target host
+    PASSWORD_HASH_ROUNDS: int = Field(12, ge=4, le=31)
+    
     # Application configuration
     APP_NAME: str = "IDOR Vulnerability Demo"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
     
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Build settings once (reads .env and validates) and reuse them"""
+    return Settings()
 
 
 # Global configuration instance
-settings = Settings() 
\ No newline at end of file
+settings = get_settings() 
\ No newline at end of file
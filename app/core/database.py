@@ -1,28 +1,78 @@
 """
 Database configuration
 """
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.dialects import postgresql, sqlite
 from app.core.config import settings
 
 # Database engine configuration
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+if "sqlite" in settings.DATABASE_URL:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL journaling with NORMAL sync avoids an fsync on every commit"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        # LIFO reuses the most recently returned connections, keeping a
+        # small warm set and letting idle extras expire via pool_recycle
+        pool_use_lifo=True
+    )
 
 # Session configuration
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps committed objects loaded, so returning them
+# after a write does not trigger a reload SELECT
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Base for models
 Base = declarative_base()
 
 
-def get_db():
+def get_db(request: Request):
     """Dependency to get database session"""
     db = SessionLocal()
+    # Picked up by _set_app_user for PostgreSQL RLS (set by UserIDMiddleware)
+    db.info["app_user_id"] = getattr(request.state, "user_id", None)
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+@event.listens_for(SessionLocal, "after_begin")
+def _set_app_user(session, transaction, connection):
+    """
+    Set app.user_id for RLS at the start of each transaction
+    Mitigation #2: runs on the same connection as the request's queries
+    """
+    user_id = session.info.get("app_user_id")
+    if user_id is not None and connection.dialect.name == "postgresql":
+        # Equivalent to SET LOCAL: reset when the transaction ends, no commit needed
+        connection.execute(
+            text("SELECT set_config('app.user_id', :uid, true)"), {"uid": str(user_id)}
+        )
+
+
+def insert_on_conflict(db: Session, model):
+    """INSERT construct for the session's dialect, supporting ON CONFLICT DO NOTHING"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
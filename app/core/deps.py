@@ -0,0 +1,7 @@
+"""
+Shared FastAPI dependency objects
+"""
+from fastapi.security import HTTPBearer
+
+# Single HTTP Bearer scheme for every authenticated route
+bearer_scheme = HTTPBearer(auto_error=True)
@@ -3,22 +3,25 @@ Security utilities for JWT and passwords
 """
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from jwt import InvalidTokenError
 from app.core.config import settings
 
-# Password hashing configuration
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT decoder and accepted algorithms, built once at import
+_jwt = jwt.PyJWT()
+_ALGORITHMS = [settings.ALGORITHM]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
 def get_password_hash(password: str) -> str:
     """Generate hash for a password"""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS)
+    return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -34,13 +37,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def decode_token(token: str) -> dict:
+    """Verify a JWT token and return its payload (raises InvalidTokenError)"""
+    return _jwt.decode(token, settings.SECRET_KEY, algorithms=_ALGORITHMS)
+
+
 def verify_token(token: str) -> str:
     """Verify and decode a JWT token"""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise ValueError("Invalid token: no username found")
         return username
-    except JWTError:
+    except InvalidTokenError:
         raise ValueError("Invalid token: decoding error") 
\ No newline at end of file
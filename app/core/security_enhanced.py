@@ -1,58 +1,90 @@
 """
 Enhanced security utilities with JWT authentication and user ID extraction
 """
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from app.core.config import settings
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials
+from jwt import ExpiredSignatureError, InvalidTokenError
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.core.deps import bearer_scheme
+from app.core.security import decode_token
+from app.models.user import User
 
-# HTTP Bearer authentication
-bearer = HTTPBearer()
+
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Verify a JWT once and cache its (sub, exp) claims by raw token
+    Expiry is re-checked by the caller on every cache hit
+    """
+    payload = decode_token(token)
+    return payload.get("sub"), payload.get("exp")
 
 
-def get_current_user_id(creds: HTTPAuthorizationCredentials = Depends(bearer)) -> int:
+def decode_user_id(token: str) -> int:
     """
-    Extract user ID from JWT token
-    Returns user_id for route-level owner checks
+    Decode a raw JWT and return its user ID
+    Raises 401 if the token is invalid, expired or has no subject
     """
     try:
-        payload = jwt.decode(creds.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id = payload.get("sub")
+        user_id, exp = _decode_token(token)
+        if exp is not None and exp <= time.time():
+            raise ExpiredSignatureError("Signature has expired")
         if user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token: no user_id found"
             )
         return int(user_id)
-    except (JWTError, ValueError, TypeError):
+    except (InvalidTokenError, ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
 
 
-def get_current_user_with_id(creds: HTTPAuthorizationCredentials = Depends(bearer)):
+def get_current_user_id(
+    request: Request,
+    creds: HTTPAuthorizationCredentials = Depends(bearer_scheme)
+) -> int:
+    """
+    Extract user ID from JWT token
+    Returns user_id for route-level owner checks, reusing the value
+    already decoded by UserIDMiddleware when present
+    """
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is not None:
+        return user_id
+    return decode_user_id(creds.credentials)
+
+
+def get_current_user(
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get the authenticated user object
+    Shared by every dependency that needs the User, so FastAPI's
+    dependency cache loads it at most once per request
+    """
+    user = db.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def get_current_user_with_id(user: User = Depends(get_current_user)):
     """
     Get both user object and user_id for comprehensive checks
     """
-    from app.core.database import get_db
-    from app.models.user import User
-    from sqlalchemy.orm import Session
-    
-    user_id = get_current_user_id(creds)
-    
-    # Get database session
-    db = next(get_db())
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found"
-            )
-        return user, user_id
-    finally:
-        db.close()
+    return user, user.id
 
 
 def verify_ownership(resource_owner_id: int, current_user_id: int, is_admin: bool = False) -> bool:
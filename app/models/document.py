@@ -1,7 +1,8 @@
 """
 Document model for demonstrating RLS and ownership checks
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -10,6 +11,12 @@ class Document(Base):
     """Document model with ownership tracking"""
     
     __tablename__ = "documents"
+    __table_args__ = (
+        # Leading owner_id also covers owner-only lookups
+        Index("ix_documents_owner_id_id", "owner_id", "id"),
+    )
+    # Fetch server-generated timestamps via RETURNING on INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -18,5 +25,8 @@ class Document(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Never lazy-loaded: per-row owner fetches must opt in via selectinload()
+    owner = relationship("User", lazy="raise")
+
     def __repr__(self):
         return f"<Document(id={self.id}, title='{self.title}', owner_id={self.owner_id})>" 
\ No newline at end of file
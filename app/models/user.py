@@ -1,9 +1,11 @@
 """
 User model
 """
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, Index, func
 from app.core.database import Base
 
+ADMIN_ROLE = "admin"
+
 
 class User(Base):
     """User model in database"""
@@ -17,5 +19,10 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     role = Column(String, default="user")
 
+    __table_args__ = (
+        # Case-insensitive email lookups and uniqueness
+        Index("users_email_lower_idx", func.lower(email), unique=True),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>" 
\ No newline at end of file
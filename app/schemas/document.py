@@ -28,6 +28,18 @@ class DocumentResponse(DocumentBase):
         from_attributes = True
 
 
+class DocumentSummaryResponse(BaseModel):
+    """Schema for document list entries (no content)"""
+    id: int
+    title: str
+    owner_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class DocumentUpdate(BaseModel):
     """Schema for updating a document"""
     title: Optional[str] = None
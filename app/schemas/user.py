@@ -8,11 +8,13 @@ from typing import Optional
 class UserBase(BaseModel):
     """Base schema for users"""
     username: str
-    email: EmailStr
+    email: str
 
 
 class UserCreate(UserBase):
     """Schema for creating a user"""
+    # Validated once on write; responses read already-validated data
+    email: EmailStr
     password: str
 
 
@@ -1,13 +1,22 @@
 """
 Document service with ownership checks and RLS support
 """
+from sqlalchemy import Row, delete, or_, select, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from app.core.database import insert_on_conflict
 from app.models.document import Document
+from app.models.user import ADMIN_ROLE, User
 from app.schemas.document import DocumentCreate, DocumentUpdate
 from app.core.security_enhanced import verify_ownership
 
 
+def _owner_or_admin(current_user_id: int):
+    """WHERE clause matching documents the user owns, or any document for admins"""
+    current_role = select(User.role).where(User.id == current_user_id).scalar_subquery()
+    return or_(Document.owner_id == current_user_id, current_role == ADMIN_ROLE)
+
+
 class DocumentService:
     """Service for document operations with ownership verification"""
     
@@ -17,17 +26,18 @@ class DocumentService:
         db_document = Document(
             title=document_data.title,
             content=document_data.content,
-            owner_id=owner_id
+            owner_id=owner_id,
+            # Explicit None: nothing left for eager_defaults to post-fetch
+            updated_at=None
         )
         db.add(db_document)
         db.commit()
-        db.refresh(db_document)
         return db_document
     
     @staticmethod
     def get_document_by_id(db: Session, document_id: int) -> Optional[Document]:
         """Get document by ID (for RLS demonstration)"""
-        return db.query(Document).filter(Document.id == document_id).first()
+        return db.get(Document, document_id)
     
     @staticmethod
     def get_document_with_ownership_check(
@@ -51,52 +61,91 @@ class DocumentService:
         return document
     
     @staticmethod
-    def get_user_documents(db: Session, user_id: int) -> List[Document]:
-        """Get all documents owned by a user"""
-        return db.query(Document).filter(Document.owner_id == user_id).all()
+    def get_document_authorized(
+        db: Session,
+        document_id: int,
+        current_user_id: int
+    ) -> Optional[Document]:
+        """
+        Get document if the current user owns it or is an admin
+        Ownership and admin role are resolved in a single joined query
+        """
+        row = db.execute(
+            select(Document, User.role)
+            .join(User, User.id == current_user_id)
+            .where(
+                Document.id == document_id,
+                or_(Document.owner_id == current_user_id, User.role == ADMIN_ROLE)
+            )
+        ).first()
+        return row[0] if row else None
+    
+    @staticmethod
+    def get_user_documents(
+        db: Session,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Row]:
+        """Get a page of documents owned by a user, without their content"""
+        return db.execute(
+            select(
+                Document.id,
+                Document.title,
+                Document.owner_id,
+                Document.created_at,
+                Document.updated_at
+            )
+            .where(Document.owner_id == user_id)
+            .order_by(Document.id)
+            .limit(limit)
+            .offset(offset)
+        ).all()
     
     @staticmethod
     def update_document(
         db: Session, 
         document_id: int, 
         document_data: DocumentUpdate, 
-        current_user_id: int,
-        is_admin: bool = False
+        current_user_id: int
     ) -> Optional[Document]:
-        """Update document with ownership check"""
-        document = DocumentService.get_document_with_ownership_check(
-            db, document_id, current_user_id, is_admin
-        )
-        if not document:
-            return None
-        
-        # Update fields
-        if document_data.title is not None:
-            document.title = document_data.title
-        if document_data.content is not None:
-            document.content = document_data.content
+        """
+        Update document with ownership check
+        Single UPDATE ... WHERE owner-or-admin ... RETURNING statement
+        """
+        changes = document_data.model_dump(exclude_none=True)
+        if not changes:
+            # Nothing to write, just apply the same access check
+            return DocumentService.get_document_authorized(
+                db, document_id, current_user_id
+            )
         
+        document = db.execute(
+            update(Document)
+            .where(Document.id == document_id, _owner_or_admin(current_user_id))
+            .values(**changes)
+            .returning(Document)
+        ).scalar_one_or_none()
         db.commit()
-        db.refresh(document)
         return document
     
     @staticmethod
     def delete_document(
         db: Session, 
         document_id: int, 
-        current_user_id: int,
-        is_admin: bool = False
+        current_user_id: int
     ) -> bool:
-        """Delete document with ownership check"""
-        document = DocumentService.get_document_with_ownership_check(
-            db, document_id, current_user_id, is_admin
+        """
+        Delete document with ownership check
+        Single DELETE ... WHERE owner-or-admin statement, no row fetch
+        """
+        result = db.execute(
+            delete(Document)
+            .where(Document.id == document_id, _owner_or_admin(current_user_id))
+            .execution_options(synchronize_session=False)
         )
-        if not document:
-            return False
-        
-        db.delete(document)
         db.commit()
-        return True
+        return result.rowcount > 0
     
     @staticmethod
     def create_demo_documents(db: Session) -> List[str]:
@@ -109,20 +158,18 @@ class DocumentService:
             {"id": 5, "title": "Admin's System Notes", "content": "System administration notes", "owner_id": 5},
         ]
         
-        created_docs = []
-        for doc_data in demo_documents:
-            existing_doc = DocumentService.get_document_by_id(db, doc_data["id"])
-            if not existing_doc:
-                new_doc = Document(
-                    id=doc_data["id"],
-                    title=doc_data["title"],
-                    content=doc_data["content"],
-                    owner_id=doc_data["owner_id"]
-                )
-                db.add(new_doc)
-                created_docs.append(doc_data["title"])
-            else:
-                created_docs.append(f"{doc_data['title']} (already exists)")
-        
+        # Single INSERT; RETURNING reports which rows were actually new
+        stmt = (
+            insert_on_conflict(db, Document)
+            .values(demo_documents)
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(Document.id)
+        )
+        inserted_ids = set(db.execute(stmt).scalars())
         db.commit()
-        return created_docs 
\ No newline at end of file
+        
+        return [
+            doc_data["title"] if doc_data["id"] in inserted_ids
+            else f"{doc_data['title']} (already exists)"
+            for doc_data in demo_documents
+        ]
@@ -1,11 +1,22 @@
 """
 User service with business logic
 """
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import RowMapping, bindparam, func, or_, select
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.models.user import User
+from typing import Iterator, List, Optional
+from app.core.database import insert_on_conflict
+from app.models.user import ADMIN_ROLE, User
 from app.schemas.user import UserCreate
 from app.core.security import get_password_hash
+from app.utils.cache import users_cache
+
+
+# Lookup statements built once at import; only the bound values change per call
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"))
+# Columns needed by UserResponse, for listings
+_USER_LIST = select(User.id, User.username, User.email, User.is_active, User.role)
 
 
 class UserService:
@@ -14,11 +25,18 @@ class UserService:
     @staticmethod
     def create_user(db: Session, user_data: UserCreate) -> User:
         """Create a new user"""
-        # Check if user already exists
-        if UserService.get_user_by_username(db, user_data.username):
+        # Check username and email in one query; at most one row can match each
+        existing = db.query(User.username, User.email).filter(
+            or_(
+                User.username == user_data.username,
+                func.lower(User.email) == user_data.email.lower()
+            )
+        ).limit(2).all()
+        
+        if any(row.username == user_data.username for row in existing):
             raise ValueError("Username already registered")
         
-        if UserService.get_user_by_email(db, user_data.email):
+        if existing:
             raise ValueError("Email already registered")
         
         # Create new user
@@ -30,41 +48,44 @@ class UserService:
         )
         db.add(db_user)
         db.commit()
-        db.refresh(db_user)
+        users_cache.clear()
         return db_user
     
     @staticmethod
     def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
     
     @staticmethod
     def get_user_by_username(db: Session, username: str) -> Optional[User]:
         """Get user by username"""
-        return db.query(User).filter(User.username == username).first()
+        return db.execute(_USER_BY_USERNAME, {"username": username}).scalar_one_or_none()
     
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
         """Get user by email"""
-        return db.query(User).filter(User.email == email).first()
+        # first(): pre-migration databases may hold case-variant duplicates
+        return db.execute(_USER_BY_EMAIL, {"email": email.lower()}).scalars().first()
     
     @staticmethod
-    def get_all_users(db: Session) -> List[User]:
-        """Get all users"""
-        return db.query(User).all()
+    def get_all_users(db: Session, limit: int = 100, offset: int = 0) -> List[RowMapping]:
+        """Get a page of users as plain column mappings (no ORM instances)"""
+        return db.execute(
+            _USER_LIST.order_by(User.id).limit(limit).offset(offset)
+        ).mappings().all()
     
     @staticmethod
-    def can_access_user(current_user: User, target_user_id: int, db: Session) -> bool:
-        """Check if a user can access another user's data"""
-        # User can access their own data
-        if current_user.id == target_user_id:
-            return True
-        
-        # Admins can access any user
-        if current_user.role == "admin":
-            return True
-        
-        return False
+    def iter_all_users(db: Session) -> Iterator[RowMapping]:
+        """Stream every user in batches of 500 without loading the full table"""
+        yield from db.execute(
+            _USER_LIST.order_by(User.id).execution_options(yield_per=500)
+        ).mappings()
+    
+    @staticmethod
+    def can_access_user(current_user: User, target_user_id: int) -> bool:
+        """Check if a user can access another user's data (own data, or admin)"""
+        # Role first: on admin-heavy workloads it settles most checks
+        return current_user.role == ADMIN_ROLE or current_user.id == target_user_id
     
     @staticmethod
     def create_demo_users(db: Session) -> List[str]:
@@ -77,22 +98,52 @@ class UserService:
             {"id": 5, "username": "admin", "email": "admin@example.com", "password": "admin123", "role": "admin"},
         ]
         
-        created_users = []
-        for user_data in demo_users:
-            existing_user = UserService.get_user_by_username(db, user_data["username"])
-            if not existing_user:
-                hashed_password = get_password_hash(user_data["password"])
-                new_user = User(
-                    id=user_data["id"],
-                    username=user_data["username"],
-                    email=user_data["email"],
-                    hashed_password=hashed_password,
-                    role=user_data["role"]
-                )
-                db.add(new_user)
-                created_users.append(user_data["username"])
-            else:
-                created_users.append(f"{user_data['username']} (already exists)")
+        # One IN query instead of a lookup per demo user
+        names = [user_data["username"] for user_data in demo_users]
+        existing = {
+            row.username
+            for row in db.query(User.username).filter(User.username.in_(names)).all()
+        }
+        
+        new_users = [
+            user_data for user_data in demo_users
+            if user_data["username"] not in existing
+        ]
+        
+        # Hash every password first so the insert is a single round-trip.
+        # bcrypt releases the GIL, so the hashes run in parallel threads.
+        hashes = []
+        if new_users:
+            with ThreadPoolExecutor(max_workers=min(8, len(new_users))) as executor:
+                hashes = list(executor.map(
+                    get_password_hash, [user_data["password"] for user_data in new_users]
+                ))
+        
+        to_insert = [
+            {
+                "id": user_data["id"],
+                "username": user_data["username"],
+                "email": user_data["email"],
+                "hashed_password": hashed_password,
+                "role": user_data["role"]
+            }
+            for user_data, hashed_password in zip(new_users, hashes)
+        ]
+        # ON CONFLICT DO NOTHING keeps concurrent setups from failing on the
+        # unique constraints; RETURNING reports the rows actually inserted
+        created = set()
+        if to_insert:
+            stmt = (
+                insert_on_conflict(db, User)
+                .values(to_insert)
+                .on_conflict_do_nothing()
+                .returning(User.username)
+            )
+            created = set(db.execute(stmt).scalars())
         
         db.commit()
-        return created_users 
\ No newline at end of file
+        users_cache.clear()
+        return [
+            name if name in created else f"{name} (already exists)"
+            for name in names
+        ]
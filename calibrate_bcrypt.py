@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Pick the bcrypt cost factor for this host
+
+Times one hash per cost factor and reports the highest factor whose hash
+stays under the target wall time. Set the result as PASSWORD_HASH_ROUNDS.
+"""
+import argparse
+import time
+import bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 16
+
+
+def time_hash(rounds: int) -> float:
+    """Seconds taken to hash a sample password at the given cost"""
+    salt = bcrypt.gensalt(rounds=rounds)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration-password", salt)
+    return time.perf_counter() - start
+
+
+def calibrate(target_seconds: float) -> int:
+    """Binary-search the highest cost whose hash time is within the target"""
+    low, high = MIN_ROUNDS, MAX_ROUNDS
+    best = MIN_ROUNDS
+    while low <= high:
+        rounds = (low + high) // 2
+        elapsed = time_hash(rounds)
+        print(f"  rounds={rounds:2d}: {elapsed * 1000:8.1f} ms")
+        if elapsed <= target_seconds:
+            best = rounds
+            low = rounds + 1
+        else:
+            high = rounds - 1
+    return best
+
+
+def main():
+    """Run the calibration"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target-ms", type=float, default=250.0,
+        help="Maximum time per hash in milliseconds (default: 250)"
+    )
+    args = parser.parse_args()
+    
+    print(f"Calibrating bcrypt for a target of {args.target_ms:.0f} ms per hash:")
+    rounds = calibrate(args.target_ms / 1000)
+    print(f"\nPASSWORD_HASH_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+-- Composite index for ownership lookups on documents
+-- Serves owner_id-only scans (get_user_documents) and id + owner_id checks
+-- New databases get this from Base.metadata.create_all; run it on existing ones.
+-- Works on both SQLite and PostgreSQL.
+
+CREATE INDEX IF NOT EXISTS ix_documents_owner_id_id ON documents (owner_id, id);
@@ -0,0 +1,48 @@
+-- Row-Level Security for documents (PostgreSQL only)
+-- Mitigation #2: the database enforces ownership using app.user_id, set with
+-- SET LOCAL semantics at the start of each request transaction (see get_db).
+--
+-- current_setting() is wrapped in a scalar subselect so PostgreSQL evaluates
+-- it once per statement (InitPlan) instead of once per row. The admin check
+-- is also uncorrelated, so it becomes an InitPlan too.
+-- current_setting(..., true) returns NULL if app.user_id was never set, but ''
+-- on a pooled connection where an earlier transaction set it locally; NULLIF
+-- maps both to NULL, which matches no rows instead of failing the ::int cast.
+--
+-- With FORCE ROW LEVEL SECURITY the unauthenticated demo seeding
+-- (/documents/demo/setup) is rejected by doc_owner_insert. Seed the demo
+-- documents before applying this file, or run the app as a role with BYPASSRLS.
+
+ALTER TABLE documents ENABLE ROW LEVEL SECURITY;
+-- Apply policies to the table owner as well (the app usually connects as owner)
+ALTER TABLE documents FORCE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS doc_owner_select ON documents;
+DROP POLICY IF EXISTS doc_owner_insert ON documents;
+DROP POLICY IF EXISTS doc_owner_update ON documents;
+DROP POLICY IF EXISTS doc_owner_delete ON documents;
+
+CREATE POLICY doc_owner_select ON documents FOR SELECT
+  USING (
+    owner_id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)
+    OR (SELECT role FROM users WHERE id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)) = 'admin'
+  );
+
+CREATE POLICY doc_owner_insert ON documents FOR INSERT
+  WITH CHECK (owner_id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int));
+
+CREATE POLICY doc_owner_update ON documents FOR UPDATE
+  USING (
+    owner_id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)
+    OR (SELECT role FROM users WHERE id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)) = 'admin'
+  )
+  WITH CHECK (
+    owner_id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)
+    OR (SELECT role FROM users WHERE id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)) = 'admin'
+  );
+
+CREATE POLICY doc_owner_delete ON documents FOR DELETE
+  USING (
+    owner_id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)
+    OR (SELECT role FROM users WHERE id = (SELECT NULLIF(current_setting('app.user_id', true), '')::int)) = 'admin'
+  );
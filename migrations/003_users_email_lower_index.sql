@@ -0,0 +1,7 @@
+-- Case-insensitive unique index on users.email
+-- get_user_by_email and create_user compare lower(email), which this index serves.
+-- New databases get this from Base.metadata.create_all; run it on existing ones.
+-- Fails if existing emails differ only by case; resolve those rows first.
+-- Works on both SQLite and PostgreSQL.
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_email_lower_idx ON users (lower(email));